@@ -12,7 +12,15 @@ No external dependencies.
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import html
+import io
+import json
+import os
+import re
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -21,77 +29,22 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 APPS_DIR = REPO_ROOT / "apps"
 OUTPUT = REPO_ROOT / "index.html"
 
+# Only fan out index.html probes once apps/ is big enough to pay for the pool
+_PARALLEL_SCAN_MIN = 32
+_SCAN_WORKERS = 16
 
-def title_case_from_name(name: str) -> str:
-    """Convert kebab-case or snake_case folder name to Title Case."""
-    # Replace both - and _ with space, then title case each word
-    normalized = name.replace("-", " ").replace("_", " ")
-    return " ".join(p.capitalize() for p in normalized.split() if p)
-
-
-def detect_apps() -> list[dict]:
-    apps = []
-    if not APPS_DIR.exists():
-        return apps
-
-    for child in sorted(APPS_DIR.iterdir(), key=lambda p: p.name.lower()):
-        if not child.is_dir():
-            continue
-
-        index_file = child / "index.html"
-        if not index_file.exists():
-            continue
-
-        folder = child.name
-        title = title_case_from_name(folder)
-
-        apps.append(
-            {
-                "folder": folder,
-                "title": title,
-                "href": f"./apps/{folder}/",
-                "path_label": f"apps/{folder}/",
-            }
-        )
-    return apps
-
+_APPS_RE = re.compile(r"<!-- apps=([0-9a-f]+) ")
+_HASH_RE = re.compile(r" hash:([0-9a-f]*) -->")
+_KEBAB_TT = str.maketrans({"-": " ", "_": " "})
 
-def render_index(apps: list[dict]) -> str:
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    cards_html = []
-    if apps:
-        for app in apps:
-            title = html.escape(app["title"])
-            href = html.escape(app["href"])
-            folder = html.escape(app["folder"])
-            path_label = html.escape(app["path_label"])
-
-            # data-search used by client-side filter
-            data_search = html.escape(f"{app['title']} {path_label} {folder}".lower())
-
-            cards_html.append(
-                f"""
-                <a class="card" href="{href}" data-search="{data_search}">
-                  <div class="card-title">{title}</div>
-                  <div class="card-sub">{path_label}</div>
-                </a>
-                """.strip()
-            )
-    else:
-        cards_html.append(
-            """
-            <div class="empty">
-              <div class="empty-title">No apps found</div>
-              <div class="empty-sub">Create <code>apps/&lt;app-name&gt;/index.html</code> then re-run the generator.</div>
-            </div>
-            """.strip()
-        )
-
-    cards = "\n".join(cards_html)
+# Static page skeleton, built once at import. Only the header marker, the
+# timestamp and the cards are filled in per render.
+_MARKER_FMT = """<!doctype html>
+<!-- apps={apps_digest} hash:{digest} -->
+"""
 
-    return f"""<!doctype html>
-<html lang="en">
+_DOC_HEAD = """<html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1" />
@@ -118,7 +71,21 @@ def render_index(apps: list[dict]) -> str:
   <meta name="theme-color" content="#111827" />
 
   <style>
-    :root {{
+"""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace (safe for the stylesheet below)."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r" ?([{};,]) ?", r"\1", css)
+    return "    " + css.replace(": ", ":").strip() + "\n"
+
+
+# Plain string, not a format template: no {{ }} escaping needed
+_CSS = _minify_css(
+    """
+    :root {
       --bg: #ffffff;
       --fg: #111111;
       --muted: #6b7280;
@@ -128,62 +95,62 @@ def render_index(apps: list[dict]) -> str:
       --shadow: 0 6px 20px rgba(0,0,0,0.06);
       --radius: 14px;
       --input-bg: #ffffff;
-    }}
+    }
 
-    * {{ box-sizing: border-box; }}
-    body {{
+    * { box-sizing: border-box; }
+    body {
       margin: 0;
       background: var(--bg);
       color: var(--fg);
       font-family: system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, "Apple Color Emoji", "Segoe UI Emoji";
-    }}
+    }
 
-    .wrap {{
+    .wrap {
       max-width: 980px;
       margin: 48px auto 80px;
       padding: 0 20px;
-    }}
+    }
 
-    header {{
+    header {
       display: grid;
       grid-template-columns: 1fr;
       gap: 14px;
       margin-bottom: 18px;
-    }}
+    }
 
-    .head-row {{
+    .head-row {
       display: flex;
       gap: 14px;
       align-items: baseline;
       justify-content: space-between;
       flex-wrap: wrap;
-    }}
+    }
 
-    .title {{
+    .title {
       font-size: 28px;
       font-weight: 700;
       letter-spacing: -0.02em;
       margin: 0;
-    }}
+    }
 
-    .subtitle {{
+    .subtitle {
       color: var(--muted);
       font-size: 14px;
       margin-top: 6px;
-    }}
+    }
 
-    .meta {{
+    .meta {
       color: var(--muted);
       font-size: 12px;
-    }}
+    }
 
-    .search {{
+    .search {
       display: flex;
       align-items: center;
       gap: 10px;
-    }}
+    }
 
-    .search input {{
+    .search input {
       width: min(520px, 100%);
       padding: 10px 12px;
       border: 1px solid var(--border);
@@ -191,42 +158,42 @@ def render_index(apps: list[dict]) -> str:
       outline: none;
       background: var(--input-bg);
       font-size: 14px;
-    }}
+    }
 
-    .search input:focus {{
+    .search input:focus {
       border-color: #cbd5e1;
       box-shadow: 0 0 0 3px rgba(0,0,0,0.04);
-    }}
+    }
 
-    .search .count {{
+    .search .count {
       color: var(--muted);
       font-size: 12px;
-    }}
+    }
 
     /* View Mode Toggle */
-    .view-toggle {{
+    .view-toggle {
       display: flex;
       align-items: center;
       gap: 8px;
       font-size: 13px;
       color: var(--muted);
-    }}
-    .view-toggle label {{ cursor: pointer; user-select: none; }}
-    .toggle-switch {{
+    }
+    .view-toggle label { cursor: pointer; user-select: none; }
+    .toggle-switch {
       position: relative;
       width: 44px;
       height: 24px;
-    }}
-    .toggle-switch input {{ opacity: 0; width: 0; height: 0; }}
-    .toggle-slider {{
+    }
+    .toggle-switch input { opacity: 0; width: 0; height: 0; }
+    .toggle-slider {
       position: absolute;
       cursor: pointer;
       top: 0; left: 0; right: 0; bottom: 0;
       background-color: #e5e7eb;
       transition: 0.2s;
       border-radius: 24px;
-    }}
-    .toggle-slider:before {{
+    }
+    .toggle-slider:before {
       position: absolute;
       content: "";
       height: 18px;
@@ -237,22 +204,22 @@ def render_index(apps: list[dict]) -> str:
       transition: 0.2s;
       border-radius: 50%;
       box-shadow: 0 1px 3px rgba(0,0,0,0.15);
-    }}
-    .toggle-switch input:checked + .toggle-slider {{ background-color: var(--accent); }}
-    .toggle-switch input:checked + .toggle-slider:before {{ transform: translateX(20px); }}
-    .toggle-switch input:focus + .toggle-slider {{ box-shadow: 0 0 0 2px rgba(0,0,0,0.1); }}
+    }
+    .toggle-switch input:checked + .toggle-slider { background-color: var(--accent); }
+    .toggle-switch input:checked + .toggle-slider:before { transform: translateX(20px); }
+    .toggle-switch input:focus + .toggle-slider { box-shadow: 0 0 0 2px rgba(0,0,0,0.1); }
 
     /* Framed Mode - Navbar + iframe */
-    .frame-container {{
+    .frame-container {
       display: none;
       position: fixed;
       top: 0; left: 0; right: 0; bottom: 0;
       z-index: 1000;
       flex-direction: column;
       background: var(--bg);
-    }}
-    .frame-container.active {{ display: flex; }}
-    .frame-navbar {{
+    }
+    .frame-container.active { display: flex; }
+    .frame-navbar {
       display: flex;
       align-items: center;
       gap: 12px;
@@ -262,8 +229,8 @@ def render_index(apps: list[dict]) -> str:
       font-size: 14px;
       flex-shrink: 0;
       box-shadow: 0 2px 8px rgba(0,0,0,0.15);
-    }}
-    .frame-navbar .nav-btn {{
+    }
+    .frame-navbar .nav-btn {
       display: inline-flex;
       align-items: center;
       justify-content: center;
@@ -277,35 +244,35 @@ def render_index(apps: list[dict]) -> str:
       cursor: pointer;
       transition: background 0.15s;
       text-decoration: none;
-    }}
-    .frame-navbar .nav-btn:hover {{ background: rgba(255,255,255,0.25); }}
-    .frame-navbar .nav-title {{
+    }
+    .frame-navbar .nav-btn:hover { background: rgba(255,255,255,0.25); }
+    .frame-navbar .nav-title {
       flex: 1;
       font-weight: 600;
       overflow: hidden;
       text-overflow: ellipsis;
       white-space: nowrap;
-    }}
-    .frame-navbar .nav-path {{
+    }
+    .frame-navbar .nav-path {
       font-size: 12px;
       opacity: 0.7;
       font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, monospace;
-    }}
-    .app-iframe {{
+    }
+    .app-iframe {
       flex: 1;
       border: none;
       width: 100%;
       height: 100%;
-    }}
+    }
 
-    .grid {{
+    .grid {
       display: grid;
       grid-template-columns: repeat(auto-fill, minmax(220px, 1fr));
       gap: 14px;
       margin-top: 12px;
-    }}
+    }
 
-    .card {{
+    .card {
       display: block;
       text-decoration: none;
       color: inherit;
@@ -316,16 +283,16 @@ def render_index(apps: list[dict]) -> str:
       transition: transform 120ms ease, box-shadow 120ms ease, background 120ms ease, border-color 120ms ease;
       overflow: hidden;
       min-width: 0;
-    }}
+    }
 
-    .card:hover {{
+    .card:hover {
       background: var(--hover);
       border-color: #d1d5db;
       box-shadow: var(--shadow);
       transform: translateY(-1px);
-    }}
+    }
 
-    .card-title {{
+    .card-title {
       font-size: 16px;
       font-weight: 650;
       color: var(--accent);
@@ -333,38 +300,40 @@ def render_index(apps: list[dict]) -> str:
       overflow: hidden;
       text-overflow: ellipsis;
       white-space: nowrap;
-    }}
+    }
 
-    .card-sub {{
+    .card-sub {
       font-size: 12px;
       color: var(--muted);
       font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", monospace;
       overflow: hidden;
       text-overflow: ellipsis;
       white-space: nowrap;
-    }}
+    }
 
-    .empty {{
+    .empty {
       border: 1px dashed var(--border);
       border-radius: var(--radius);
       padding: 22px;
       color: var(--muted);
       background: #fafafa;
-    }}
-    .empty-title {{
+    }
+    .empty-title {
       font-size: 16px;
       font-weight: 600;
       color: var(--fg);
       margin-bottom: 6px;
-    }}
-    .empty-sub code {{
+    }
+    .empty-sub code {
       background: #fff;
       border: 1px solid var(--border);
       padding: 1px 6px;
       border-radius: 6px;
-    }}
+    }
+
+    .card.hidden { display: none; }
 
-    .no-match {{
+    .no-match {
       display: none;
       border: 1px dashed var(--border);
       border-radius: var(--radius);
@@ -372,14 +341,19 @@ def render_index(apps: list[dict]) -> str:
       background: #fafafa;
       color: var(--muted);
       margin-top: 14px;
-    }}
+    }
 
-    footer {{
+    footer {
       margin-top: 28px;
       color: var(--muted);
       font-size: 12px;
-    }}
-  </style>
+    }
+"""
+)
+
+_PAGE_HEAD = _DOC_HEAD + _CSS
+
+_BODY_OPEN_FMT = """  </style>
 </head>
 <body>
   <!-- Frame container for "Framed" mode -->
@@ -410,7 +384,7 @@ def render_index(apps: list[dict]) -> str:
           <h1 class="title">Mini Apps</h1>
           <div class="subtitle">Multiple single-page HTML apps hosted under one GitHub Pages site.</div>
         </div>
-        <div class="meta">Generated: {html.escape(now)}</div>
+        <div class="meta">Generated: {now}</div>
       </div>
 
       <div class="search">
@@ -431,8 +405,18 @@ def render_index(apps: list[dict]) -> str:
 
     <main>
       <div class="grid" id="grid">
-        {cards}
+        """
+
+# Empty slots in a render_index() page, filled in by stamp_index()
+_HASH_SLOT = " hash: -->"
+_NOW_SLOT = "Generated: </div>"
+
+# Search strings for the client-side filter, one per card in grid order
+_SEARCH_INDEX_OPEN = """
       </div>
+      <script id="si" type="application/json">"""
+
+_TAIL = """</script>
       <div class="no-match" id="nomatch">
         No matching apps. Try a different keyword.
       </div>
@@ -446,35 +430,50 @@ def render_index(apps: list[dict]) -> str:
   </div>
 
   <script>
-    (function () {{
+    (function () {
       // === Search functionality ===
       const input = document.getElementById("q");
       const grid = document.getElementById("grid");
       const cards = Array.from(grid.querySelectorAll(".card"));
       const count = document.getElementById("count");
       const nomatch = document.getElementById("nomatch");
+      // Search strings come from the JSON index, not from DOM attributes
+      const hays = JSON.parse(document.getElementById("si").textContent);
+      const shown = cards.map(() => true);
 
-      function updateSearch() {{
+      function updateSearch() {
         const q = (input.value || "").trim().toLowerCase();
         let visible = 0;
 
-        for (const c of cards) {{
-          const hay = c.getAttribute("data-search") || "";
-          const ok = !q || hay.includes(q);
-          c.style.display = ok ? "" : "none";
-          if (ok) visible++;
-        }}
-
-        if (cards.length > 0) {{
+        // Match first, then apply all class changes in one batch
+        const ok = hays.map(hay => !q || hay.includes(q));
+        for (let i = 0; i < cards.length; i++) {
+          if (ok[i]) visible++;
+          if (ok[i] !== shown[i]) {
+            shown[i] = ok[i];
+            cards[i].classList.toggle("hidden", !ok[i]);
+          }
+        }
+
+        if (cards.length > 0) {
           count.textContent = visible + " / " + cards.length;
           nomatch.style.display = visible === 0 ? "block" : "none";
-        }} else {{
+        } else {
           count.textContent = "";
           nomatch.style.display = "none";
-        }}
-      }}
-
-      input.addEventListener("input", updateSearch);
+        }
+      }
+
+      // Coalesce keystrokes into at most one update per animation frame
+      let pending = false;
+      input.addEventListener("input", function() {
+        if (pending) return;
+        pending = true;
+        requestAnimationFrame(function() {
+          pending = false;
+          updateSearch();
+        });
+      });
       updateSearch();
 
       // === View Mode Toggle (Full Page vs Framed) ===
@@ -488,89 +487,275 @@ def render_index(apps: list[dict]) -> str:
       const navHome = document.getElementById("navHome");
 
       // Load saved preference
-      function loadViewMode() {{
+      function loadViewMode() {
         const saved = localStorage.getItem(STORAGE_KEY);
         viewModeToggle.checked = saved === "framed";
-      }}
+      }
 
       // Save preference
-      function saveViewMode() {{
+      function saveViewMode() {
         localStorage.setItem(STORAGE_KEY, viewModeToggle.checked ? "framed" : "fullpage");
-      }}
+      }
 
       viewModeToggle.addEventListener("change", saveViewMode);
       loadViewMode();
 
       // Check if we're in framed mode
-      function isFramedMode() {{
+      function isFramedMode() {
         return viewModeToggle.checked;
-      }}
+      }
 
       // Open app in frame
-      function openInFrame(href, title, path) {{
+      function openInFrame(href, title, path) {
         navTitle.textContent = title;
         navPath.textContent = path;
         navOpen.href = href;
         appIframe.src = href;
         frameContainer.classList.add("active");
         document.body.style.overflow = "hidden";
-      }}
+      }
 
       // Close frame and go home
-      function closeFrame() {{
+      function closeFrame() {
         frameContainer.classList.remove("active");
         appIframe.src = "about:blank";
         document.body.style.overflow = "";
-      }}
+      }
 
       // Home button click
-      navHome.addEventListener("click", function(e) {{
+      navHome.addEventListener("click", function(e) {
         e.preventDefault();
         closeFrame();
-      }});
+      });
 
       // Handle card clicks
-      for (const card of cards) {{
-        card.addEventListener("click", function(e) {{
-          if (isFramedMode()) {{
+      for (const card of cards) {
+        card.addEventListener("click", function(e) {
+          if (isFramedMode()) {
             e.preventDefault();
             const href = card.getAttribute("href");
             const title = card.querySelector(".card-title").textContent;
             const path = card.querySelector(".card-sub").textContent;
             openInFrame(href, title, path);
-          }}
+          }
           // else: default behavior (navigate to app)
-        }});
-      }}
+        });
+      }
 
       // ESC key to close frame
-      document.addEventListener("keydown", function(e) {{
-        if (e.key === "Escape" && frameContainer.classList.contains("active")) {{
+      document.addEventListener("keydown", function(e) {
+        if (e.key === "Escape" && frameContainer.classList.contains("active")) {
           closeFrame();
-        }}
-      }});
+        }
+      });
 
       // Handle browser back button when frame is open
-      window.addEventListener("popstate", function() {{
-        if (frameContainer.classList.contains("active")) {{
+      window.addEventListener("popstate", function() {
+        if (frameContainer.classList.contains("active")) {
           closeFrame();
-        }}
-      }});
-    }})();
+        }
+      });
+    })();
   </script>
 </body>
 </html>
 """
 
+_CARD_FMT = (
+    '<a class="card" href="{href_e}">'
+    '<div class="card-title">{title_e}</div>'
+    '<div class="card-sub">{path_e}</div>'
+    "</a>"
+)
+
+_EMPTY_HTML = (
+    '<div class="empty">'
+    '<div class="empty-title">No apps found</div>'
+    '<div class="empty-sub">Create <code>apps/&lt;app-name&gt;/index.html</code>'
+    " then re-run the generator.</div>"
+    "</div>"
+)
+
+
+def title_case_from_name(name: str) -> str:
+    """Convert kebab-case or snake_case folder name to Title Case."""
+    # Replace both - and _ with space, then title case each word
+    return " ".join(p.capitalize() for p in name.translate(_KEBAB_TT).split() if p)
+
+
+def detect_apps() -> list[dict]:
+    apps = []
+    # Work on DirEntry name/path strings only; no Path objects per entry.
+    # os.scandir() caches the d_type from readdir(), so is_dir() only stats
+    # symlinks (which are followed, like the old Path.is_dir()).
+    try:
+        with os.scandir(APPS_DIR) as it:
+            entries = [e for e in it if e.is_dir()]
+    except FileNotFoundError:
+        return apps
+    entries.sort(key=lambda e: e.name.lower())
+
+    index_files = [os.path.join(e.path, "index.html") for e in entries]
+    if len(entries) > _PARALLEL_SCAN_MIN:
+        # Overlap the stat() latency on slow (network) filesystems
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            found = list(executor.map(os.path.isfile, index_files))
+    else:
+        found = map(os.path.isfile, index_files)
+
+    for entry, has_index in zip(entries, found):
+        if not has_index:
+            continue
+
+        folder = entry.name
+        title = title_case_from_name(folder)
+        href = f"./apps/{folder}/"
+        path_label = f"apps/{folder}/"
+        # Used by the client-side filter via the JSON search index
+        search = (title + " " + path_label + " " + folder).lower()
+
+        apps.append(
+            {
+                "folder": folder,
+                "title": title,
+                "href": href,
+                "path_label": path_label,
+                # Pre-escaped for render_index()
+                "title_e": html.escape(title),
+                "href_e": html.escape(href),
+                "path_e": html.escape(path_label),
+                "search": search,
+            }
+        )
+    return apps
+
+
+def render_index(apps: list[dict]) -> str:
+    """Render the page with empty timestamp and hash slots (see stamp_index)."""
+    # Cards are written straight into one buffer, no per-card list or join
+    buf = io.StringIO()
+    buf.write(_MARKER_FMT.format(apps_digest=apps_hash(apps), digest=""))
+    buf.write(_PAGE_HEAD)
+    buf.write(_BODY_OPEN_FMT.format(now=""))
+
+    search = []
+    for i, app in enumerate(apps):
+        if i:
+            buf.write("\n")
+        buf.write(_CARD_FMT.format_map(app))
+        search.append(app["search"])
+    if not apps:
+        buf.write(_EMPTY_HTML)
+
+    # "<" is escaped so a folder name can never close the <script> element
+    buf.write(_SEARCH_INDEX_OPEN)
+    buf.write(json.dumps(search, separators=(",", ":")).replace("<", "\\u003c"))
+    buf.write(_TAIL)
+    return buf.getvalue()
+
+
+def stamp_index(body: str, now: str, digest: str) -> str:
+    """Fill the empty timestamp and hash slots of a render_index() page."""
+    body = body.replace(_HASH_SLOT, f" hash:{digest} -->", 1)
+    return body.replace(_NOW_SLOT, f"Generated: {html.escape(now)}</div>", 1)
+
+
+def content_hash(body: str) -> str:
+    """Hash of a page rendered without timestamp/hash, i.e. of its real content."""
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def apps_hash(apps: list[dict]) -> str:
+    """Hash of the detected app folder names, in scan order."""
+    names = "\n".join(a["folder"] for a in apps)
+    return hashlib.blake2b(names.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def read_header() -> str:
+    """Return the marker lines at the top of OUTPUT, or "" if it is missing."""
+    try:
+        with open(OUTPUT, encoding="utf-8") as f:
+            return f.readline() + f.readline()
+    except FileNotFoundError:
+        return ""
+
+
+def is_up_to_date(apps: list[dict]) -> bool:
+    """Return True if OUTPUT is newer than apps/ and lists the same app folders."""
+    try:
+        out_mtime = OUTPUT.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+    # mtimes alone are not trusted (checkouts rewrite them), so the set of
+    # folders must match what the page was rendered from
+    match = _APPS_RE.search(read_header())
+    if match is None or match.group(1) != apps_hash(apps):
+        return False
+
+    try:
+        # Editing this script changes the page template too
+        newest = max(os.stat(APPS_DIR).st_mtime, os.stat(__file__).st_mtime)
+        for app in apps:
+            app_dir = os.path.join(APPS_DIR, app["folder"])
+            newest = max(
+                newest,
+                os.stat(app_dir).st_mtime,
+                os.stat(os.path.join(app_dir, "index.html")).st_mtime,
+            )
+    except FileNotFoundError:
+        # An app vanished since the scan
+        return False
+    return newest <= out_mtime
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write pre-encoded bytes to a temp file, then rename it over path.
+
+    The rename keeps a running server from serving a half-written page.
+    """
+    tmp = str(path.with_suffix(path.suffix + ".tmp"))
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            # Keep the existing file's permissions across the rename
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        # Never leave a stray index.html.tmp in the repo root
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
 
 def main() -> int:
     apps = detect_apps()
-    content = render_index(apps)
+    print(f"[gen_index] Found {len(apps)} app(s).")
 
-    APPS_DIR.mkdir(parents=True, exist_ok=True)
-    OUTPUT.write_text(content, encoding="utf-8")
+    if APPS_DIR.exists() and is_up_to_date(apps):
+        print(f"[gen_index] Up to date: {OUTPUT.relative_to(REPO_ROOT)}")
+        return 0
 
-    print(f"[gen_index] Found {len(apps)} app(s).")
+    # Render once without timestamp/hash; only the timestamp would differ on
+    # an unchanged page, so keep the old file if the content hash matches
+    body = render_index(apps)
+    digest = content_hash(body)
+    match = _HASH_RE.search(read_header())
+    if match is not None and match.group(1) == digest:
+        print(f"[gen_index] Unchanged: {OUTPUT.relative_to(REPO_ROOT)}")
+        return 0
+
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    content = stamp_index(body, now, digest).encode("utf-8")
+
+    APPS_DIR.mkdir(parents=True, exist_ok=True)
+    write_atomic(OUTPUT, content)
     print(f"[gen_index] Wrote: {OUTPUT.relative_to(REPO_ROOT)}")
 
     return 0
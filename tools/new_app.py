@@ -10,7 +10,7 @@ Features:
     style.css
     main.js
     assets/
-- Optionally updates root index.html by calling tools/gen_index.py.
+- Optionally updates root index.html via tools/gen_index.py.
 
 No external dependencies.
 """
@@ -28,6 +28,9 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 APPS_DIR = REPO_ROOT / "apps"
 GEN_INDEX = REPO_ROOT / "tools" / "gen_index.py"
 
+_NAME_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+_NAME_WARNING = "[new_app] Warning: app name should be kebab-case like 'my-cool-app'."
+
 
 INDEX_TEMPLATE = """<!doctype html>
 <html lang="en">
@@ -135,6 +138,9 @@ code {
 }
 """
 
+# style.css has no placeholders, so encode it once
+_STYLE_BYTES = STYLE_TEMPLATE.encode("utf-8")
+
 
 MAIN_TEMPLATE = """\
 // {title} - main script
@@ -156,11 +162,8 @@ def to_title(name: str) -> str:
 
 def validate_name(name: str) -> None:
     # Soft validation: allow alnum + dash
-    if not re.fullmatch(r"[a-z0-9]+(?:-[a-z0-9]+)*", name):
-        print(
-            "[new_app] Warning: app name should be kebab-case like 'my-cool-app'.",
-            file=sys.stderr,
-        )
+    if not _NAME_RE.fullmatch(name):
+        print(_NAME_WARNING, file=sys.stderr)
 
 
 def scaffold(name: str, with_css: bool, with_js: bool) -> Path:
@@ -174,29 +177,52 @@ def scaffold(name: str, with_css: bool, with_js: bool) -> Path:
     (app_dir / "assets").mkdir(parents=True, exist_ok=True)
 
     title = to_title(name)
-    (app_dir / "index.html").write_text(
-        INDEX_TEMPLATE.format(title=title, folder=name), encoding="utf-8"
+    (app_dir / "index.html").write_bytes(
+        INDEX_TEMPLATE.format(title=title, folder=name).encode("utf-8")
     )
 
     if with_css:
-        (app_dir / "style.css").write_text(STYLE_TEMPLATE, encoding="utf-8")
+        (app_dir / "style.css").write_bytes(_STYLE_BYTES)
 
     if with_js:
-        (app_dir / "main.js").write_text(
-            MAIN_TEMPLATE.format(title=title), encoding="utf-8"
+        (app_dir / "main.js").write_bytes(
+            MAIN_TEMPLATE.format(title=title).encode("utf-8")
         )
 
     return app_dir
 
 
 def update_index() -> None:
-    if not GEN_INDEX.exists():
+    # Imported here so plain scaffolding neither needs nor loads gen_index
+    tools_dir = str(Path(__file__).resolve().parent)
+    if tools_dir not in sys.path:
+        sys.path.insert(0, tools_dir)
+
+    try:
+        import gen_index
+    except ModuleNotFoundError as e:
+        if e.name != "gen_index":
+            print(f"[new_app] Index update failed: {e}", file=sys.stderr)
+            return
         print(
             "[new_app] gen_index.py not found. Skipping index update.", file=sys.stderr
         )
         return
+    except Exception as e:
+        print(f"[new_app] Index update failed: {e}", file=sys.stderr)
+        return
 
-    subprocess.run([sys.executable, str(GEN_INDEX)], check=False)
+    gen_main = getattr(gen_index, "main", None)
+    if gen_main is None:
+        # No main() to call; run it as a script instead
+        subprocess.run([sys.executable, str(GEN_INDEX)], check=False)
+        return
+
+    # Run in-process; best effort, like the old subprocess call
+    try:
+        gen_main()
+    except Exception as e:
+        print(f"[new_app] Index update failed: {e}", file=sys.stderr)
 
 
 def main() -> int:
@@ -18,6 +18,7 @@ No external dependencies.
 
 from __future__ import annotations
 
+import os
 import re
 import sys
 from pathlib import Path
@@ -28,11 +29,24 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 APPS_DIR = REPO_ROOT / "apps"
 GEN_INDEX = REPO_ROOT / "tools" / "gen_index.py"
 
+_NAME_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+_TITLE_TRANS = str.maketrans("-_", "  ")
+
+_HEADER = """
+╔════════════════════════════════════════════════════════════╗
+║           🚀 New App Interactive Wizard                    ║
+║                                                            ║
+║  Create a new single-HTML app with customizable options.   ║
+║  Press Enter to accept default values shown in [brackets]. ║
+╚════════════════════════════════════════════════════════════╝
+
+"""
+
 
 def to_title(name: str) -> str:
     """Convert kebab-case or snake_case to Title Case."""
     # Replace both - and _ with spaces, then title case
-    return " ".join(p.capitalize() for p in re.split(r"[-_]", name) if p)
+    return " ".join(p.capitalize() for p in name.translate(_TITLE_TRANS).split())
 
 
 def prompt(message: str, default: str = "") -> str:
@@ -60,7 +74,7 @@ def prompt_yes_no(message: str, default: bool = True) -> bool:
 
 def validate_name(name: str) -> bool:
     """Validate app name format. Returns True if valid, False otherwise."""
-    if not re.fullmatch(r"[a-z0-9]+(?:-[a-z0-9]+)*", name):
+    if not _NAME_RE.fullmatch(name):
         print(
             "  ⚠ Warning: app name should be kebab-case like 'my-cool-app'.",
             file=sys.stderr,
@@ -69,20 +83,7 @@ def validate_name(name: str) -> bool:
     return True
 
 
-def check_app_exists(name: str) -> bool:
-    """Check if app folder already exists."""
-    app_dir = APPS_DIR / name
-    return app_dir.exists()
-
-
-def get_index_template(
-    title: str, folder: str, description: str, with_css: bool, with_js: bool
-) -> str:
-    """Generate index.html content based on options."""
-    css_link = '  <link rel="stylesheet" href="./style.css" />\n' if with_css else ""
-    js_script = '\n  <script type="module" src="./main.js"></script>' if with_js else ""
-
-    return f"""<!doctype html>
+_INDEX_TMPL = """<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -118,7 +119,7 @@ def get_index_template(
     <section class="card">
       <h2>It works 🎉</h2>
       <p>
-        Edit <code>index.html</code>{", <code>style.css</code>" if with_css else ""}{", and <code>main.js</code>" if with_js else ""}
+        Edit <code>index.html</code>{extra_edits}
         to build your app.
       </p>
     </section>
@@ -129,6 +130,28 @@ def get_index_template(
 """
 
 
+def get_index_template(
+    title: str, folder: str, description: str, with_css: bool, with_js: bool
+) -> str:
+    """Generate index.html content based on options."""
+    css_link = '  <link rel="stylesheet" href="./style.css" />\n' if with_css else ""
+    js_script = '\n  <script type="module" src="./main.js"></script>' if with_js else ""
+    extra_edits = (", <code>style.css</code>" if with_css else "") + (
+        ", and <code>main.js</code>" if with_js else ""
+    )
+
+    return _INDEX_TMPL.format_map(
+        {
+            "title": title,
+            "folder": folder,
+            "description": description,
+            "css_link": css_link,
+            "js_script": js_script,
+            "extra_edits": extra_edits,
+        }
+    )
+
+
 STYLE_TEMPLATE = """\
 :root {
   --bg: #ffffff;
@@ -186,10 +209,11 @@ code {
 }
 """
 
+# style.css has no placeholders, so encode it once
+_STYLE_BYTES = STYLE_TEMPLATE.encode("utf-8")
 
-def get_main_template(title: str) -> str:
-    """Generate main.js content."""
-    return f"""\
+
+_MAIN_TMPL = """\
 // {title} - main script
 // Keep things simple and relative-path safe for GitHub Pages.
 
@@ -203,6 +227,11 @@ init();
 """
 
 
+def get_main_template(title: str) -> str:
+    """Generate main.js content."""
+    return _MAIN_TMPL.format(title=title)
+
+
 def scaffold(
     name: str,
     title: str,
@@ -210,82 +239,116 @@ def scaffold(
     with_css: bool,
     with_js: bool,
     with_assets: bool,
-) -> Path:
-    """Create the app directory structure and files."""
-    APPS_DIR.mkdir(parents=True, exist_ok=True)
+) -> tuple[Path, list[tuple[Path, bool]]]:
+    """Create the app directory structure and files.
 
+    Returns the app folder and the created entries as (path, is_dir) pairs.
+    """
+    # Encode every payload before touching the filesystem
+    index_bytes = get_index_template(
+        title, name, description, with_css, with_js
+    ).encode("utf-8")
+    main_bytes = get_main_template(title).encode("utf-8") if with_js else None
+
+    APPS_DIR.mkdir(parents=True, exist_ok=True)
     app_dir = APPS_DIR / name
-    if app_dir.exists():
-        raise FileExistsError(f"App folder already exists: {app_dir}")
+    try:
+        app_dir.mkdir(parents=True, exist_ok=False)
+    except FileExistsError:
+        raise FileExistsError(f"App folder already exists: {app_dir}") from None
 
-    app_dir.mkdir(parents=True, exist_ok=False)
+    created = []
 
     if with_assets:
         (app_dir / "assets").mkdir(parents=True, exist_ok=True)
+        created.append((app_dir / "assets", True))
 
-    (app_dir / "index.html").write_text(
-        get_index_template(title, name, description, with_css, with_js),
-        encoding="utf-8",
-    )
+    (app_dir / "index.html").write_bytes(index_bytes)
+    created.append((app_dir / "index.html", False))
 
     if with_css:
-        (app_dir / "style.css").write_text(STYLE_TEMPLATE, encoding="utf-8")
+        (app_dir / "style.css").write_bytes(_STYLE_BYTES)
+        created.append((app_dir / "style.css", False))
 
     if with_js:
-        (app_dir / "main.js").write_text(get_main_template(title), encoding="utf-8")
+        (app_dir / "main.js").write_bytes(main_bytes)
+        created.append((app_dir / "main.js", False))
 
-    return app_dir
+    return app_dir, created
 
 
 def update_index() -> None:
-    """Run gen_index.py to update the root index.html."""
-    if not GEN_INDEX.exists():
+    """Run gen_index.py in-process to update the root index.html."""
+    tools_dir = str(Path(__file__).resolve().parent)
+    if tools_dir not in sys.path:
+        sys.path.insert(0, tools_dir)
+
+    try:
+        import gen_index
+    except ModuleNotFoundError as e:
+        if e.name != "gen_index":
+            print(f"  ⚠ Index update failed: {e}", file=sys.stderr)
+            return
         print("  ⚠ gen_index.py not found. Skipping index update.", file=sys.stderr)
         return
+    except Exception as e:
+        print(f"  ⚠ Index update failed: {e}", file=sys.stderr)
+        return
+
+    gen_main = getattr(gen_index, "main", None)
+    if gen_main is None:
+        # No main() to call; run it as a script instead
+        subprocess.run([sys.executable, str(GEN_INDEX)], check=False)
+        return
 
-    subprocess.run([sys.executable, str(GEN_INDEX)], check=False)
+    try:
+        gen_main()
+    except Exception as e:
+        print(f"  ⚠ Index update failed: {e}", file=sys.stderr)
 
 
 def print_header() -> None:
     """Print the interactive wizard header."""
-    print()
-    print("╔════════════════════════════════════════════════════════════╗")
-    print("║           🚀 New App Interactive Wizard                    ║")
-    print("║                                                            ║")
-    print("║  Create a new single-HTML app with customizable options.   ║")
-    print("║  Press Enter to accept default values shown in [brackets]. ║")
-    print("╚════════════════════════════════════════════════════════════╝")
-    print()
+    sys.stdout.write(_HEADER)
 
 
 def print_summary(config: dict) -> None:
     """Print configuration summary before creating."""
-    print()
-    print("┌────────────────────────────────────────────────────────────┐")
-    print("│  📋 Configuration Summary                                  │")
-    print("├────────────────────────────────────────────────────────────┤")
-    print(f"│  Folder:      {config['name']:<44} │")
-    print(f"│  Title:       {config['title']:<44} │")
     desc_display = (
         config["description"][:42] + "..."
         if len(config["description"]) > 44
         else config["description"]
     )
-    print(f"│  Description: {desc_display:<44} │")
-    print(f"│  CSS:         {'Yes ✓' if config['with_css'] else 'No  ✗':<44} │")
-    print(f"│  JavaScript:  {'Yes ✓' if config['with_js'] else 'No  ✗':<44} │")
-    print(f"│  Assets:      {'Yes ✓' if config['with_assets'] else 'No  ✗':<44} │")
-    print(f"│  Update index:{'Yes ✓' if config['update_index'] else 'No  ✗':<44} │")
-    print("└────────────────────────────────────────────────────────────┘")
-    print()
+    css = "Yes ✓" if config["with_css"] else "No  ✗"
+    js = "Yes ✓" if config["with_js"] else "No  ✗"
+    assets = "Yes ✓" if config["with_assets"] else "No  ✗"
+    update_index = "Yes ✓" if config["update_index"] else "No  ✗"
+    sys.stdout.write(
+        f"""
+┌────────────────────────────────────────────────────────────┐
+│  📋 Configuration Summary                                  │
+├────────────────────────────────────────────────────────────┤
+│  Folder:      {config['name']:<44} │
+│  Title:       {config['title']:<44} │
+│  Description: {desc_display:<44} │
+│  CSS:         {css:<44} │
+│  JavaScript:  {js:<44} │
+│  Assets:      {assets:<44} │
+│  Update index:{update_index:<44} │
+└────────────────────────────────────────────────────────────┘
+
+"""
+    )
 
 
 def main() -> int:
     print_header()
 
     # Step 1: Folder name (required)
-    print("📁 Step 1/7: Folder Name")
-    print("   Use kebab-case like 'my-cool-app'")
+    sys.stdout.write(
+        "📁 Step 1/7: Folder Name\n"
+        "   Use kebab-case like 'my-cool-app'\n"
+    )
     while True:
         name = prompt("   Folder name")
         name = name.lower().strip()
@@ -296,7 +359,7 @@ def main() -> int:
                 continue
 
         # Check if exists
-        if check_app_exists(name):
+        if os.path.exists(os.path.join(str(APPS_DIR), name)):
             print(f"  ⚠ App folder already exists: apps/{name}")
             continue
 
@@ -304,40 +367,52 @@ def main() -> int:
     print()
 
     # Step 2: Title
-    print("📝 Step 2/7: App Title")
-    print("   Human-readable title for your app")
+    sys.stdout.write(
+        "📝 Step 2/7: App Title\n"
+        "   Human-readable title for your app\n"
+    )
     default_title = to_title(name)
     title = prompt("   Title", default=default_title)
     print()
 
     # Step 3: Description (for SEO)
-    print("📄 Step 3/7: Description (for SEO)")
-    print("   A short description for meta tags")
+    sys.stdout.write(
+        "📄 Step 3/7: Description (for SEO)\n"
+        "   A short description for meta tags\n"
+    )
     default_description = f"{title} - A lightweight single-page HTML app."
     description = prompt("   Description", default=default_description)
     print()
 
     # Step 4: CSS
-    print("🎨 Step 4/7: Include CSS")
-    print("   Create a style.css file with starter styles")
+    sys.stdout.write(
+        "🎨 Step 4/7: Include CSS\n"
+        "   Create a style.css file with starter styles\n"
+    )
     with_css = prompt_yes_no("   Include style.css?", default=True)
     print()
 
     # Step 5: JavaScript
-    print("⚡ Step 5/7: Include JavaScript")
-    print("   Create a main.js file with ES module setup")
+    sys.stdout.write(
+        "⚡ Step 5/7: Include JavaScript\n"
+        "   Create a main.js file with ES module setup\n"
+    )
     with_js = prompt_yes_no("   Include main.js?", default=True)
     print()
 
     # Step 6: Assets folder
-    print("📦 Step 6/7: Include Assets Folder")
-    print("   Create an empty assets/ folder for images, etc.")
+    sys.stdout.write(
+        "📦 Step 6/7: Include Assets Folder\n"
+        "   Create an empty assets/ folder for images, etc.\n"
+    )
     with_assets = prompt_yes_no("   Include assets folder?", default=True)
     print()
 
     # Step 7: Update index
-    print("🔄 Step 7/7: Update Landing Page")
-    print("   Run gen_index.py to add link to root index.html")
+    sys.stdout.write(
+        "🔄 Step 7/7: Update Landing Page\n"
+        "   Run gen_index.py to add link to root index.html\n"
+    )
     run_gen_index = prompt_yes_no("   Update root index.html?", default=True)
     print()
 
@@ -362,7 +437,7 @@ def main() -> int:
     # Create the app
     print()
     try:
-        app_dir = scaffold(
+        app_dir, created = scaffold(
             name=name,
             title=title,
             description=description,
@@ -378,21 +453,23 @@ def main() -> int:
 
     # List created files
     print("\n📂 Files created:")
-    for item in sorted(app_dir.rglob("*")):
-        if item.is_file():
-            print(f"   • {item.relative_to(app_dir)}")
-        elif item.is_dir():
+    for item, is_dir in created:
+        if is_dir:
             print(f"   📁 {item.relative_to(app_dir)}/")
+        else:
+            print(f"   • {item.relative_to(app_dir)}")
 
     if run_gen_index:
         print("\n🔄 Updating root index.html...")
         update_index()
         print("✅ Updated root index.html")
 
-    print("\n🎉 Done! Your new app is ready at:")
-    print(f"   Local:  http://localhost:8000/apps/{name}/")
-    print(f"   GitHub: https://daviddwlee84.github.io/HTML-Apps/apps/{name}/")
-    print()
+    sys.stdout.write(
+        "\n🎉 Done! Your new app is ready at:\n"
+        f"   Local:  http://localhost:8000/apps/{name}/\n"
+        f"   GitHub: https://daviddwlee84.github.io/HTML-Apps/apps/{name}/\n"
+        "\n"
+    )
 
     return 0
 